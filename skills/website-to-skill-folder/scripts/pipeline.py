@@ -44,19 +44,29 @@ Input handling:
 """
 
 import argparse
+import gzip
 import hashlib
+import itertools
 import json
 import logging
 import os
+import random
 import re
 import shutil
 import subprocess
 import sys
 import tempfile
+import textwrap
+import threading
 import time
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import Iterable, Iterator
+from urllib.parse import urlparse, urlsplit
 
 # Force UTF-8 on stdout/stderr so status lines with em-dashes, arrows, and box-
 # drawing characters render correctly (and never crash with UnicodeEncodeError) on
@@ -80,6 +90,7 @@ import preflight
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
     from pydantic import BaseModel, field_validator
     from tenacity import (
         before_sleep_log,
@@ -183,6 +194,11 @@ class PipelineInput(BaseModel):
     no_install: bool = False  # Skip npx skills install after the GitHub push
     work_dir: str | None = None  # Persistent local working dir (temp dir if None)
     keep_temp: bool = False  # Keep the temp working dir after the run (debugging)
+    no_clean: bool = False  # Skip clean_markdown; trust Firecrawl's onlyMainContent output as-is
+    api_cache_hours: float = 0  # Reuse identical map/submit responses this fresh (0 = off)
+    batch_size: int = 100  # URLs per Firecrawl batch-scrape job
+    no_json: bool = False  # Scrape markdown only; skip the LLM JSON extraction (no summaries)
+    cache_age_hours: float | None = None  # Firecrawl maxAge for scrapes (None = Firecrawl default)
 
     # Resolved fields (set by validators)
     domain: str = ""
@@ -228,7 +244,7 @@ class PipelineInput(BaseModel):
         elif not v.startswith(("http://", "https://")):
             v = f"https://{v}"
 
-        parsed = urlparse(v)
+        parsed = urlsplit(v)
         if not parsed.netloc:
             raise ValueError(
                 f"Could not parse a domain from '{v}'.\n"
@@ -258,9 +274,34 @@ class PipelineInput(BaseModel):
             raise ValueError("Limit cannot exceed 100,000 (Firecrawl API max)")
         return v
 
+    @field_validator("batch_size")
+    @classmethod
+    def validate_batch_size(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("Batch size must be at least 1")
+        if v > 1000:
+            raise ValueError("Batch size cannot exceed 1,000")
+        return v
+
+    @field_validator("cache_age_hours")
+    @classmethod
+    def validate_cache_age_hours(cls, v: float | None) -> float | None:
+        if v is not None and v < 0:
+            raise ValueError("Cache age cannot be negative")
+        return v
+
+    @field_validator("api_cache_hours")
+    @classmethod
+    def validate_api_cache_hours(cls, v: float) -> float:
+        if v < 0:
+            raise ValueError("API cache age cannot be negative")
+        if v > 24:
+            raise ValueError("API cache age cannot exceed 24 hours (Firecrawl job retention)")
+        return v
+
     def model_post_init(self, __context) -> None:
         """Resolve domain and map_url from the validated URL."""
-        parsed = urlparse(self.url)
+        parsed = urlsplit(self.url)
         netloc = parsed.netloc.lower()
 
         # Strip www. -- it's cosmetic, not a real subdomain
@@ -435,6 +476,56 @@ def parse_args() -> PipelineInput:
         action="store_true",
         help="Keep the temp working directory after the run (for debugging).",
     )
+    parser.add_argument(
+        "--no-clean",
+        action="store_true",
+        help=(
+            "Write page markdown exactly as Firecrawl returned it (onlyMainContent), "
+            "skipping the client-side artifact cleanup. Changes existing page files."
+        ),
+    )
+    parser.add_argument(
+        "--no-json",
+        action="store_true",
+        help=(
+            "Scrape markdown only, skipping Firecrawl's LLM JSON extraction: faster and "
+            "~1 credit per page instead of ~5. Pages get no summary; titles and "
+            "descriptions come from the page's meta tags. Pages scraped this way are "
+            "cached summary-less and stay so on later normal runs until --force-refresh."
+        ),
+    )
+    parser.add_argument(
+        "--cache-age-hours",
+        type=float,
+        default=None,
+        metavar="HOURS",
+        help=(
+            "Accept Firecrawl's server-side cached copy of a page if it is at most HOURS "
+            "old (sent as maxAge) — near-instant and cheaper when re-scraping recently "
+            "scraped URLs. 0 forces a fresh fetch. Default: Firecrawl's own default."
+        ),
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=100,
+        metavar="N",
+        help=(
+            "URLs per Firecrawl batch-scrape job (default: 100, max 1000). Larger jobs mean "
+            "fewer submits and poll loops; smaller ones resume at finer granularity."
+        ),
+    )
+    parser.add_argument(
+        "--api-cache-hours",
+        type=float,
+        default=0,
+        metavar="HOURS",
+        help=(
+            "Development aid: reuse an identical Map / batch-submit response made within "
+            "the last HOURS (max 24) instead of calling Firecrawl again. Cached on disk "
+            "under ~/.cache/website-to-skill/. Default 0 (off); ignored with --force-refresh."
+        ),
+    )
 
     args = parser.parse_args()
 
@@ -481,6 +572,11 @@ def parse_args() -> PipelineInput:
             no_install=args.no_install,
             work_dir=args.work_dir,
             keep_temp=args.keep_temp,
+            no_clean=args.no_clean,
+            api_cache_hours=args.api_cache_hours,
+            batch_size=args.batch_size,
+            no_json=args.no_json,
+            cache_age_hours=args.cache_age_hours,
         )
     except Exception as e:
         parser.error(str(e))
@@ -497,9 +593,18 @@ CREDS_PATH = os.path.join(
     "credentials.json",
 )
 
-BATCH_SIZE = 100          # URLs per batch scrape request
-POLL_INTERVAL = 5         # seconds between status checks
-MAX_POLL_TIME = 600       # 10 minutes max wait per batch
+BATCH_SIZE = 100          # Default URLs per batch scrape request (--batch-size)
+SCRAPE_CREDITS_PER_PAGE = 1  # Markdown scrape
+JSON_CREDITS_PER_PAGE = 4    # LLM JSON extraction on top of the scrape (off with --no-json)
+POLL_INTERVAL_MIN = 1.0   # first status check after submit, and near a batch's finish (seconds)
+POLL_INTERVAL_PROGRESS = 5.0  # backoff restart while a batch advances (seconds)
+POLL_INTERVAL_MAX = 15.0  # backoff ceiling between status checks (seconds)
+POLL_NEAR_DONE = 0.9      # completed/total from which progress restarts at POLL_INTERVAL_MIN
+POLL_HEARTBEAT = 60       # re-print an unchanged batch status at most this often (seconds)
+MAX_POLL_TIME = 600       # 10 minutes max wait per BATCH_SIZE URLs (scales with larger batches)
+MAX_CONCURRENT_BATCHES = 4  # Batches submitted + polled in parallel (Firecrawl queues
+                            # the rest server-side; kept modest so queued batches
+                            # don't burn their MAX_POLL_TIME waiting for a slot)
 REQUEST_TIMEOUT = (10, 30)  # (connect_timeout, read_timeout) in seconds
 DELETION_MISS_THRESHOLD = 3  # Consecutive map misses before deleting a page file
 MAX_DELETION_RATIO = 0.30    # Circuit breaker: if a single map run would remove >= this
@@ -508,6 +613,30 @@ MAX_DELETION_RATIO = 0.30    # Circuit breaker: if a single map run would remove
                              # the last-known-good map, and skip deletions this run.
                              # Override a genuine mass removal with --allow-mass-deletion.
 MAX_SLUG_LEN = 80         # Max slug length to avoid Windows MAX_PATH (260 char) crashes
+# Files in dev/_workspace/ (the scrape cache that travels with the skill repo)
+STATE_FILE = "state.json"                       # Per-batch scrape state + resume info
+MAP_URLS_FILE = "map-urls.txt"                  # Last trusted map, one URL per line
+MAP_REQUEST_FILE = "map-request.json"           # url/limit the cached map was made with
+PAGE_CACHE_FILE = "batch-response.json.gz"      # Consolidated scrape cache (git-ignored)
+LEGACY_PAGE_CACHE_FILE = "batch-response.json"  # Uncompressed name used by older runs
+WORKSPACE_CACHE_FILES = (
+    STATE_FILE, PAGE_CACHE_FILE, LEGACY_PAGE_CACHE_FILE, MAP_URLS_FILE, MAP_REQUEST_FILE,
+)
+API_CACHE_DIR = os.path.join(     # Opt-in Firecrawl response cache (--api-cache-hours)
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "website-to-skill",
+    "firecrawl",
+)
+API_CACHE_MAX_AGE = 24 * 3600     # --api-cache-hours cap: older entries can never be reused
+
+# One pooled, keep-alive session for every Firecrawl call. The poll loop issues
+# dozens of small GETs per batch; reusing connections skips a TCP + TLS handshake
+# on each. Retries stay with tenacity (RETRY_CONFIG) — the adapter does none.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=MAX_CONCURRENT_BATCHES * 2),
+)
 
 # JSON extraction prompt -- tells Firecrawl's LLM what we want (see plan.md D3)
 # Optimized for hybrid keyword (ripgrep) + semantic (agent reasoning) search
@@ -651,7 +780,7 @@ def validate_api_key(api_key: str) -> None:
     # Lightweight auth check: hit the /v1/scrape endpoint with an empty body.
     # A valid key returns 422 (validation error); an invalid key returns 401.
     try:
-        resp = requests.post(
+        resp = SESSION.post(
             f"{FIRECRAWL_BASE}/v1/scrape",
             headers={"Authorization": f"Bearer {api_key}"},
             json={},
@@ -666,6 +795,61 @@ def validate_api_key(api_key: str) -> None:
         logger.warning(f"Could not validate API key (network error: {e}). Proceeding anyway.")
 
 
+def firecrawl_post(
+    url: str, headers: dict, payload: dict, cache_ttl: float = 0
+) -> tuple[dict, bool]:
+    """POST a JSON payload to Firecrawl; return (decoded response body, from_cache).
+
+    With cache_ttl > 0 (seconds), a successful response is stored in API_CACHE_DIR
+    under sha256(endpoint + credentials + canonical payload), and an identical
+    request made within cache_ttl is answered from disk instead of the network
+    (from_cache=True -- no credits spent). A stale entry is deleted when read;
+    entries past API_CACHE_MAX_AGE are swept whenever a new one is written.
+    """
+    if cache_ttl <= 0:
+        resp = SESSION.post(url, headers=headers, json=payload, timeout=REQUEST_TIMEOUT)
+        resp.raise_for_status()
+        return json.loads(resp.content), False
+
+    key = hashlib.sha256(
+        "\n".join(
+            [url, headers.get("Authorization", ""), json.dumps(payload, sort_keys=True)]
+        ).encode("utf-8")
+    ).hexdigest()
+    cache_path = os.path.join(API_CACHE_DIR, f"{key}.json.gz")
+    try:
+        if time.time() - os.path.getmtime(cache_path) < cache_ttl:
+            with gzip.open(cache_path, "rt", encoding="utf-8") as f:
+                return json.load(f), True
+        os.remove(cache_path)  # expired
+    except (OSError, EOFError, json.JSONDecodeError):
+        pass
+
+    resp = SESSION.post(url, headers=headers, json=payload, timeout=REQUEST_TIMEOUT)
+    resp.raise_for_status()
+    data = json.loads(resp.content)
+    if data.get("success"):
+        os.makedirs(API_CACHE_DIR, exist_ok=True)
+        _prune_api_cache()
+        temp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+        with gzip.open(temp_path, "wb", compresslevel=1) as f:
+            f.write(resp.content)
+        os.replace(temp_path, cache_path)
+    return data, False
+
+
+def _prune_api_cache() -> None:
+    """Delete API cache entries too old for any --api-cache-hours value to reuse."""
+    cutoff = time.time() - API_CACHE_MAX_AGE
+    with os.scandir(API_CACHE_DIR) as it:
+        for entry in it:
+            try:
+                if entry.name.endswith(".json.gz") and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except OSError:
+                pass  # removed by a concurrent worker, or unreadable -- skip it
+
+
 def domain_to_skill_name(domain: str) -> str:
     """Convert domain to skill name format: domain-website-search-skill.
 
@@ -678,6 +862,16 @@ def domain_to_skill_name(domain: str) -> str:
     return skill_name
 
 
+# ASCII translation table for url_to_slug: a-z, 0-9 and "-" are kept, A-Z fold to
+# lowercase, "/" becomes the "--" separator, everything else is dropped. One C-level
+# pass instead of replace() + lower() + re.sub().
+_SLUG_TABLE = {c: None for c in range(128)}
+_SLUG_TABLE.update({ord(c): c for c in "abcdefghijklmnopqrstuvwxyz0123456789-"})
+_SLUG_TABLE.update({ord(c): c.lower() for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"})
+_SLUG_TABLE[ord("/")] = "--"
+_SLUG_STRIP_RE = re.compile(r"[^a-z0-9\-]")  # Non-ASCII fallback of the same whitelist
+
+
 def url_to_slug(url: str) -> str:
     """Convert a URL path to a filesystem-safe slug (see plan.md D9).
 
@@ -686,13 +880,23 @@ def url_to_slug(url: str) -> str:
     Truncated slugs remain unique because the hash is derived from the
     full original URL.
     """
-    path = urlparse(url.rstrip("/")).path.strip("/")
+    # urlsplit skips urlparse's ";params" scan; only a path that actually has a ";"
+    # needs urlparse, which drops the last segment's params (existing slugs rely on it).
+    trimmed = url.rstrip("/")
+    path = urlsplit(trimmed).path
+    if ";" in path:
+        path = urlparse(trimmed).path
+    path = path.strip("/")
     if not path:
         return "index"
-    slug = path.replace("/", "--")
-    slug = re.sub(r"[^a-z0-9\-]", "", slug.lower())
+    if path.isascii():
+        slug = path.translate(_SLUG_TABLE)
+    else:
+        # str.lower() folds a few non-ASCII letters into ASCII ones (e.g. the
+        # Kelvin sign -> "k"); keep the two-step form so those slugs don't change.
+        slug = _SLUG_STRIP_RE.sub("", path.replace("/", "--").lower())
     if len(slug) > MAX_SLUG_LEN:
-        url_hash = hashlib.sha256(url.encode()).hexdigest()[:8]
+        url_hash = hashlib.sha256(url.encode()).digest()[:4].hex()
         slug = slug[:MAX_SLUG_LEN] + "-" + url_hash
     return slug
 
@@ -709,18 +913,54 @@ def filter_content_urls(urls: list[str]) -> list[str]:
 
     Filters out Next.js/Nuxt build artifacts, CSS/JS bundles, fonts, images,
     and other binary assets that Firecrawl's map step may include but should
-    never be scraped as skill pages.
+    never be scraped as skill pages. Also drops URLs that would land on an
+    already-kept page file (see dedupe_urls_by_slug), so the same page is never
+    scraped -- and billed -- twice.
     """
     filtered = [u for u in urls if not _STATIC_ASSET_RE.search(u)]
     removed = len(urls) - len(filtered)
     if removed:
         print(f"  Filtered {removed} static asset URL(s) from map results")
-    return filtered
+    deduped = dedupe_urls_by_slug(filtered)
+    if len(deduped) < len(filtered):
+        print(f"  Dropped {len(filtered) - len(deduped)} duplicate URL(s) with the same page slug")
+    return deduped
 
 
-def yaml_escape(s: str) -> str:
-    """Escape a string for YAML double-quoted scalar."""
-    return s.replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+def dedupe_urls_by_slug(urls: list[str]) -> list[str]:
+    """Keep one URL per page slug, in map order.
+
+    /about, /about/ and /About all write pages/about.md, so scraping more than one
+    of them only pays for a page that is overwritten. The kept URL is the shortest
+    of its group, preferring all-lowercase, then lexically first -- independent of
+    the order Firecrawl lists them in, so consecutive maps agree and no variant
+    reads as deleted.
+    """
+    chosen: dict[str, tuple[int, bool, str]] = {}
+    for url in urls:
+        slug = url_to_slug(url)
+        rank = (len(url), url != url.lower(), url)
+        if slug not in chosen or rank < chosen[slug]:
+            chosen[slug] = rank
+    if len(chosen) == len(urls):
+        return urls
+    keep = {rank[2] for rank in chosen.values()}
+    return list(dict.fromkeys(u for u in urls if u in keep))
+
+
+def yaml_quote(s: str) -> str:
+    """Render a string as a YAML double-quoted scalar, newlines folded to spaces.
+
+    A JSON string literal is a valid YAML double-quoted scalar, so json.dumps
+    does the quoting and all escaping (backslash, quote, control characters) in
+    one C-level pass.
+    """
+    return json.dumps(s.replace("\n", " "), ensure_ascii=False)
+
+
+_BR_TAG_RE = re.compile(r"<br\s*/?>", re.IGNORECASE)
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
 
 
 def strip_html_tags(text: str) -> str:
@@ -732,70 +972,75 @@ def strip_html_tags(text: str) -> str:
     if not text:
         return text
     
-    # Convert <br> and <br/> to spaces (preserve word boundaries)
-    text = re.sub(r'<br\s*/?>', ' ', text, flags=re.IGNORECASE)
-    
-    # Remove all other HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
+    # Most fields hold no markup at all; without a "<" neither tag pattern can match
+    if "<" in text:
+        # Convert <br> and <br/> to spaces (preserve word boundaries)
+        text = _BR_TAG_RE.sub(' ', text)
+
+        # Remove all other HTML tags
+        text = _HTML_TAG_RE.sub('', text)
     
     # Clean up multiple spaces
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     
     return text.strip()
 
 
+def _is_markup_artifact(line: str) -> bool:
+    """True for icon-font / SVG class-name soup rather than content.
+
+    Pattern: multiple words connected by dashes/underscores, no spaces, very long,
+    with capitals — e.g. "Book-Open-1--Streamline-UltimatesvgCheck-Circle...".
+    """
+    stripped = line.strip()
+    return (
+        len(stripped) > 100
+        and " " not in stripped
+        and (stripped.count("-") > 10 or stripped.count("_") > 10)
+        and any(char.isupper() for char in stripped)  # Has capital letters (class name pattern)
+    )
+
+
 def clean_markdown(md: str) -> str:
     """Minimal cleanup - strips leading empty lines and obvious technical artifacts.
-    
+
     Relies on Firecrawl's onlyMainContent and excludeTags for content quality.
     Only removes obvious technical artifacts (icon class names, SVG references)
     that are clearly not content. Let the AI agent use judgment for navigation
     elements (see SKILL.md guidance).
+
+    Artifact lines are over 100 chars, so a plain len() check screens out nearly
+    every line before the full test, and a page with nothing to drop is returned
+    without being re-joined.
     """
     lines = md.split("\n")
-    cleaned_lines = []
-    
-    for line in lines:
-        stripped = line.strip()
-        
-        # Skip empty lines at the start
-        if not stripped and not cleaned_lines:
-            continue
-        
-        # Skip obvious technical artifacts: long concatenated class names (icon fonts, SVG classes)
-        # Pattern: Multiple words connected by dashes/underscores, no spaces, very long
-        # This catches things like "Book-Open-1--Streamline-UltimatesvgCheck-Circle..."
-        if (
-            len(stripped) > 100 
-            and not " " in stripped 
-            and (stripped.count("-") > 10 or stripped.count("_") > 10)
-            and any(char.isupper() for char in stripped)  # Has capital letters (class name pattern)
-        ):
-            continue
-        
-        cleaned_lines.append(line)
-    
-    result = "\n".join(cleaned_lines)
-    
-    # Remove leading/trailing whitespace
-    return result.strip()
+    kept = [line for line in lines if len(line) <= 100 or not _is_markup_artifact(line)]
+    if len(kept) == len(lines):
+        return md.strip()
+    return "\n".join(kept).strip()
 
 
-def wrap_summary(summary: str, indent: int = 2, width: int = 80) -> str:
-    """Word-wrap summary text with given indent."""
+@lru_cache(maxsize=None)
+def _summary_wrapper(indent: int, width: int) -> textwrap.TextWrapper:
+    """One TextWrapper per (indent, width), built once and reused for every page."""
     prefix = " " * indent
-    words = summary.split()
-    lines = []
-    line = prefix
-    for word in words:
-        if len(line) + len(word) + 1 > width:
-            lines.append(line.rstrip())
-            line = prefix + word + " "
-        else:
-            line += word + " "
-    if line.strip():
-        lines.append(line.rstrip())
-    return "\n".join(lines)
+    return textwrap.TextWrapper(
+        width=width - 1,
+        initial_indent=prefix,
+        subsequent_indent=prefix,
+        break_long_words=False,
+        break_on_hyphens=False,
+    )
+
+
+def wrap_summary(summary: str, indent: int = 2, width: int = 80) -> str:
+    """Word-wrap summary text with given indent.
+
+    Lines stay strictly shorter than `width`; words are never split, so an
+    over-long word (e.g. a URL) gets a line of its own.
+    """
+    # Collapse runs of whitespace first, like a word split
+    return _summary_wrapper(indent, width).fill(" ".join(summary.split()))
 
 
 # ---------------------------------------------------------------------------
@@ -808,7 +1053,7 @@ def load_state(workspace_dir: str) -> dict:
 
     Handles corruption gracefully -- falls back to empty state with a warning.
     """
-    state_path = os.path.join(workspace_dir, "state.json")
+    state_path = os.path.join(workspace_dir, STATE_FILE)
     if os.path.exists(state_path):
         try:
             with open(state_path, encoding="utf-8") as f:
@@ -821,22 +1066,169 @@ def load_state(workspace_dir: str) -> dict:
     return {"map": {}, "batches": {}}
 
 
+# Built once and reused for every state.json write (one per finished batch).
+_STATE_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+# batch_id -> (entry, its encoded JSON indented for state["batches"]), for the
+# batches completed during the current batch_scrape only. A completed entry is
+# never mutated again (_set_batch_state swaps in a new dict), so its text can be
+# reused on every later save of the run; holding the entry keeps the identity
+# check sound. Batches loaded from disk aren't cached (that would keep a second
+# copy of the whole crawl in memory), and batch_scrape clears it on return.
+_BATCH_JSON_CACHE: dict[str, tuple[dict, str]] = {}
+
+
+def _encode_batch(batch_id: str, entry: dict) -> str:
+    """Encode one state["batches"] entry, reusing the cached text when there is one."""
+    cached = _BATCH_JSON_CACHE.get(batch_id)
+    if cached and cached[0] is entry:
+        return cached[1]
+    return _STATE_ENCODER.encode(entry).replace("\n", "\n    ")
+
+
+def _encode_state(state: dict) -> str:
+    """Encode state exactly as _STATE_ENCODER.encode(state) would.
+
+    Batches completed in this run never change once written, so their encoded
+    text is cached and spliced in rather than re-serializing every page scraped
+    so far on each of the run's saves.
+    """
+    batches = state.get("batches")
+    if not isinstance(batches, dict) or not batches:
+        return _STATE_ENCODER.encode(state)
+    encode = _STATE_ENCODER.encode
+    parts = ["{"]
+    for key, value in state.items():
+        parts.append("\n  " if len(parts) == 1 else ",\n  ")
+        parts.append(f"{encode(key)}: ")
+        if key == "batches":
+            for i, (batch_id, entry) in enumerate(batches.items()):
+                parts.append("{\n    " if i == 0 else ",\n    ")
+                parts.append(f"{encode(batch_id)}: ")
+                parts.append(_encode_batch(batch_id, entry))
+            parts.append("\n  }")
+        else:
+            parts.append(encode(value).replace("\n", "\n  "))
+    parts.append("\n}")
+    return "".join(parts)
+
+
 def save_state(workspace_dir: str, state: dict) -> None:
-    """Save state.json atomically using temp file + rename."""
-    state_path = os.path.join(workspace_dir, "state.json")
+    """Save state.json atomically using temp file + rename.
+
+    Encoded by _encode_state and written in one call rather than json.dump's
+    chunk-by-chunk writes. The output format must stay as is: state.json is
+    committed with the skill repo, so any reformatting would show up as a
+    full-file diff.
+    """
+    state_path = os.path.join(workspace_dir, STATE_FILE)
     temp_path = state_path + ".tmp"
     with open(temp_path, "w", encoding="utf-8") as f:
-        json.dump(state, f, indent=2, ensure_ascii=False)
+        f.write(_encode_state(state))
     os.replace(temp_path, state_path)
 
 
+def page_cache_path(workspace_dir: str) -> str | None:
+    """Return the consolidated scrape cache in workspace_dir, or None if there is none.
+
+    Prefers the gzipped cache; falls back to a plain batch-response.json left by
+    an older run.
+    """
+    for name in (PAGE_CACHE_FILE, LEGACY_PAGE_CACHE_FILE):
+        path = os.path.join(workspace_dir, name)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def save_page_cache(workspace_dir: str, pages: list[dict]) -> str:
+    """Write the consolidated batch-response.json.gz cache; return its path.
+
+    Compact, one page object per line, streamed page by page: json.dumps on a
+    single page takes the C encoder fast path (json.dump with indent=2 does not),
+    and the whole cache is never built as one giant string. Gzipped at level 1 —
+    scraped markdown is repetitive text, so the file shrinks several-fold for
+    little CPU. Written via temp file + rename so an interrupted run never leaves
+    a torn cache behind; a legacy uncompressed cache is removed once replaced.
+    """
+    cache_path = os.path.join(workspace_dir, PAGE_CACHE_FILE)
+    temp_path = cache_path + ".tmp"
+    with gzip.open(temp_path, "wt", encoding="utf-8", compresslevel=1) as f:
+        f.write("[")
+        for i, page in enumerate(pages):
+            f.write(",\n" if i else "\n")
+            f.write(json.dumps(page, ensure_ascii=False))
+        f.write("\n]\n")
+    os.replace(temp_path, cache_path)
+
+    legacy_path = os.path.join(workspace_dir, LEGACY_PAGE_CACHE_FILE)
+    if os.path.exists(legacy_path):
+        os.remove(legacy_path)
+    return cache_path
+
+
+def iter_page_cache(cache_path: str) -> Iterator[dict]:
+    """Yield pages from a batch-response cache one at a time.
+
+    The compact layout save_page_cache writes ("[" line, one page per line, "]")
+    is streamed line by line, so peak memory is a single page rather than the
+    whole scrape. Older caches (uncompressed, pretty-printed, or a {"data": [...]}
+    object) are detected from the name and first entry and loaded the old way.
+    """
+    opener = gzip.open if cache_path.endswith(".gz") else open
+    with opener(cache_path, "rt", encoding="utf-8") as f:
+        first = f.readline().strip()
+        second = f.readline().strip()
+        streamable = first == "["
+        if streamable and second != "]":
+            try:
+                streamable = isinstance(json.loads(second.rstrip(",")), dict)
+            except json.JSONDecodeError:
+                streamable = False
+
+        if streamable:
+            for line in itertools.chain([second], f):
+                line = line.strip().rstrip(",")
+                if line and line != "]":
+                    yield json.loads(line)
+            return
+
+    with opener(cache_path, "rt", encoding="utf-8") as f:
+        scrape_data = json.load(f)
+    yield from (
+        scrape_data if isinstance(scrape_data, list) else scrape_data.get("data", [])
+    )
+
+
+def page_cache_intact(cache_path: str) -> bool:
+    """True if cache_path is a gzipped page cache that decompresses cleanly to the end.
+
+    gzip checks the CRC and length trailer once the stream is exhausted, so a
+    truncated or corrupt file fails here without parsing any JSON. A legacy
+    uncompressed cache returns False, so callers replace it.
+    """
+    if not cache_path.endswith(".gz"):
+        return False
+    try:
+        with gzip.open(cache_path, "rb") as f:
+            while f.read(1 << 20):
+                pass
+    except (OSError, EOFError, zlib.error):
+        return False
+    return True
+
+
 def get_batch_id(urls: list[str]) -> str:
     """Generate deterministic batch ID from sorted URLs.
 
-    Same set of URLs always produces the same batch_id (idempotency).
+    Same set of URLs always produces the same batch_id (idempotency). The ID is
+    also the resume key in committed state.json files, so the hash input and
+    algorithm must not change. batch_scrape computes it once per batch.
     """
-    urls_str = "\n".join(sorted(urls))
-    return hashlib.sha256(urls_str.encode()).hexdigest()[:16]
+    # Sorting the UTF-8 bytes gives the same order as sorting the strings (UTF-8
+    # preserves code-point order), but compares with memcmp; the joined bytes
+    # hashed are identical, so existing IDs are unchanged.
+    return hashlib.sha256(b"\n".join(sorted(u.encode() for u in urls))).digest()[:8].hex()
 
 
 def update_deletion_candidates(
@@ -913,6 +1305,10 @@ def compare_maps(new_urls: list[str], cached_urls: list[str]) -> dict:
             "unchanged": [...], # URLs in both
             "deleted": [...]    # URLs in cache but not new
         }
+
+    All three are sorted. The order is load-bearing, not cosmetic: unscraped
+    "unchanged" URLs are re-batched after a crash, and only the same sorted
+    chunking reproduces the batch IDs of the batches left "polling" in state.
     """
     new_set = set(new_urls)
     cached_set = set(cached_urls)
@@ -967,46 +1363,52 @@ def assess_map_health(
     return {"trusted": True, "reason": "", "deleted_ratio": ratio}
 
 
-def load_existing_pages(urls: list[str], workspace_dir: str) -> list[dict]:
+def load_existing_pages(
+    urls: list[str],
+    workspace_dir: str,
+    state: dict | None = None,
+) -> list[dict]:
     """Load previously scraped pages for the given URLs from cache.
 
-    Tries state.json first (more granular), falls back to batch-response.json.
+    Tries state.json first (more granular), falls back to the batch-response cache.
+    Both scans stop as soon as every URL is found; the cache is streamed page by page.
+    Pass `state` when the caller already holds it, to skip re-reading state.json.
     """
     if not urls:
         return []
 
-    url_set = set(urls)
-    pages = []
-    seen_urls: set[str] = set()
+    remaining = set(urls)  # URLs still to find; one membership test per page
+    found: dict[str, dict] = {}
 
     # Try state.json first
-    state = load_state(workspace_dir)
+    if state is None:
+        state = load_state(workspace_dir)
     for batch_state in state.get("batches", {}).values():
         if batch_state.get("status") != "completed":
             continue
         for page in batch_state.get("pages", []):
             page_url = page.get("metadata", {}).get("sourceURL", "")
-            if page_url in url_set and page_url not in seen_urls:
-                pages.append(page)
-                seen_urls.add(page_url)
-
-    # Fallback to batch-response.json for any remaining
-    if len(seen_urls) < len(url_set):
-        cache_path = os.path.join(workspace_dir, "batch-response.json")
-        if os.path.exists(cache_path):
-            try:
-                with open(cache_path, encoding="utf-8") as f:
-                    all_pages = json.load(f)
-                if isinstance(all_pages, list):
-                    for page in all_pages:
-                        page_url = page.get("metadata", {}).get("sourceURL", "")
-                        if page_url in url_set and page_url not in seen_urls:
-                            pages.append(page)
-                            seen_urls.add(page_url)
-            except (json.JSONDecodeError, OSError) as e:
-                logger.warning(f"Could not load batch-response.json: {e}")
+            if page_url in remaining:
+                found[page_url] = page
+                remaining.discard(page_url)
+                if not remaining:
+                    return list(found.values())  # all found -- skip the rest and the cache
+
+    # Fallback to the batch-response cache for any remaining
+    cache_path = page_cache_path(workspace_dir)
+    if remaining and cache_path:
+        try:
+            for page in iter_page_cache(cache_path):
+                page_url = page.get("metadata", {}).get("sourceURL", "")
+                if page_url in remaining:
+                    found[page_url] = page
+                    remaining.discard(page_url)
+                    if not remaining:
+                        break
+        except (json.JSONDecodeError, OSError, EOFError) as e:
+            logger.warning(f"Could not load {os.path.basename(cache_path)}: {e}")
 
-    return pages
+    return list(found.values())
 
 
 def _plural(n: int, word: str) -> str:
@@ -1033,9 +1435,9 @@ def unscraped_unchanged_urls(unchanged_urls: list[str], existing_pages: list[dic
 
 @retry(**RETRY_CONFIG)
 def _map_website_api_call(
-    map_url: str, api_key: str, limit: int
-) -> list[str]:
-    """Make the Map API call with automatic retries.
+    map_url: str, api_key: str, limit: int, cache_ttl: float = 0
+) -> tuple[list[str], bool]:
+    """Make the Map API call with automatic retries; return (links, from_cache).
 
     Retries on transient failures (network, rate limit, server errors).
     Raises immediately on permanent failures (400, 401, 403, 404).
@@ -1045,6 +1447,7 @@ def _map_website_api_call(
     list (TTL of several minutes) that can miss pages published moments ago — the
     cause of an incremental re-run reporting "0 new" right after a page goes live.
     The map costs 1 credit whether cached or fresh, so there is no cost downside.
+    cache_ttl > 0 opts into the local response cache (see firecrawl_post).
     """
     headers = {
         "Authorization": f"Bearer {api_key}",
@@ -1058,19 +1461,25 @@ def _map_website_api_call(
         "ignoreCache": True,
     }
 
-    resp = requests.post(
-        f"{FIRECRAWL_BASE}/v1/map", headers=headers, json=payload,
-        timeout=REQUEST_TIMEOUT,
-    )
-    resp.raise_for_status()
-    data = resp.json()
+    data, from_cache = firecrawl_post(f"{FIRECRAWL_BASE}/v1/map", headers, payload, cache_ttl)
 
     if not data.get("success"):
         raise RuntimeError(
             f"Map API returned success=false: {json.dumps(data, indent=2)[:500]}"
         )
 
-    return data.get("links", [])
+    return data.get("links", []), from_cache
+
+
+def _map_credits_note(from_cache: bool) -> str:
+    """Credit note for the map step: a response from the local API cache costs nothing."""
+    return "0 credits (cached)" if from_cache else "1 credit used"
+
+
+def _read_map_urls(map_path: str) -> list[str]:
+    """Read map-urls.txt: one bulk read, split and stripped at C level, blanks dropped."""
+    with open(map_path, encoding="utf-8") as f:
+        return [url for url in map(str.strip, f.read().split("\n")) if url]
 
 
 def map_website(
@@ -1081,6 +1490,7 @@ def map_website(
     skip_scrape: bool = False,
     force_refresh: bool = False,
     allow_mass_deletion: bool = False,
+    cache_ttl: float = 0,
 ) -> dict:
     """Map website with incremental update / idempotency / force-refresh support.
 
@@ -1089,6 +1499,9 @@ def map_website(
       --skip-scrape:         Use cache if valid, skip API (idempotency).
       --force-refresh:       Ignore cache, call API, treat all URLs as new.
 
+    cache_ttl (seconds) lets the Map call itself be answered from the local
+    response cache; force_refresh always goes to the network.
+
     Returns:
         {
             "urls": [...],           # All URLs
@@ -1102,15 +1515,16 @@ def map_website(
     print(f"STEP 1: Map -- discovering pages on {map_url}")
     print(f"{'='*60}")
 
-    map_path = os.path.join(workspace_dir, "map-urls.txt")
-    map_request_path = os.path.join(workspace_dir, "map-request.json")
+    map_path = os.path.join(workspace_dir, MAP_URLS_FILE)
+    map_request_path = os.path.join(workspace_dir, MAP_REQUEST_FILE)
 
     # --- Force refresh: ignore cache, call API ---
     if force_refresh:
         print("  Force refresh: ignoring cache")
-        new_urls = filter_content_urls(_map_website_api_call(map_url, api_key, limit))
+        links, from_cache = _map_website_api_call(map_url, api_key, limit)
+        new_urls = filter_content_urls(links)
         cached_urls: list[str] = []
-        print(f"  Found {len(new_urls)} URLs (1 credit used)")
+        print(f"  Found {len(new_urls)} URLs ({_map_credits_note(from_cache)})")
 
     # --- Idempotency (--skip-scrape): use cache if available ---
     elif skip_scrape:
@@ -1122,8 +1536,7 @@ def map_website(
                     cached_request.get("url") == map_url
                     and cached_request.get("limit") == limit
                 ):
-                    with open(map_path, encoding="utf-8") as f:
-                        cached_urls = [line.strip() for line in f if line.strip()]
+                    cached_urls = _read_map_urls(map_path)
                     print(f"  Using cached map ({len(cached_urls)} URLs, 0 credits)")
                     return {
                         "urls": cached_urls,
@@ -1137,22 +1550,25 @@ def map_website(
 
         # Cache miss or mismatch -- fall through to API call
         print("  No valid cache -- calling Map API")
-        new_urls = filter_content_urls(_map_website_api_call(map_url, api_key, limit))
+        links, from_cache = _map_website_api_call(map_url, api_key, limit, cache_ttl)
+        new_urls = filter_content_urls(links)
         cached_urls = []
-        print(f"  Found {len(new_urls)} URLs (1 credit used)")
+        print(f"  Found {len(new_urls)} URLs ({_map_credits_note(from_cache)})")
 
     # --- Default: incremental update ---
     else:
         print("  Incremental update: getting fresh map to detect changes")
-        new_urls = filter_content_urls(_map_website_api_call(map_url, api_key, limit))
-        print(f"  Found {len(new_urls)} URLs (1 credit used)")
+        links, from_cache = _map_website_api_call(map_url, api_key, limit, cache_ttl)
+        new_urls = filter_content_urls(links)
+        print(f"  Found {len(new_urls)} URLs ({_map_credits_note(from_cache)})")
 
         # Load cached map for comparison
+        # Deduped like the fresh map, so a map-urls.txt saved before slug
+        # dedupe doesn't report the dropped variants as deleted pages.
         cached_urls = []
         if os.path.exists(map_path):
             try:
-                with open(map_path, encoding="utf-8") as f:
-                    cached_urls = [line.strip() for line in f if line.strip()]
+                cached_urls = dedupe_urls_by_slug(_read_map_urls(map_path))
             except OSError:
                 cached_urls = []
 
@@ -1176,15 +1592,26 @@ def map_website(
     # Persist the new map ONLY when trusted — otherwise keep the last-known-good
     # snapshot so a glitchy run can't poison the next run's comparison (which would
     # otherwise re-scrape the whole site against an emptied cache).
+    # A steady-state run (same URL set, same request) rewrites nothing.
+    comparison = compare_maps(new_urls, cached_urls)
     if trusted:
-        with open(map_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(new_urls))
-        with open(map_request_path, "w", encoding="utf-8") as f:
-            json.dump({"url": map_url, "limit": limit}, f)
-        print(f"  Saved URL list to {map_path}")
+        if comparison["new"] or comparison["deleted"] or not os.path.exists(map_path):
+            # Streamed one line per URL: no joined copy of a 100k-URL map in memory.
+            with open(map_path, "w", encoding="utf-8") as f:
+                f.writelines(f"{url}\n" for url in new_urls)
+            print(f"  Saved URL list to {map_path}")
+        else:
+            print(f"  URL list unchanged -- kept {map_path}")
 
-    # Compare for incremental update
-    comparison = compare_maps(new_urls, cached_urls)
+        map_request = {"url": map_url, "limit": limit}
+        try:
+            with open(map_request_path, encoding="utf-8") as f:
+                request_current = json.load(f) == map_request
+        except (OSError, json.JSONDecodeError):
+            request_current = False
+        if not request_current:
+            with open(map_request_path, "w", encoding="utf-8") as f:
+                json.dump(map_request, f)
 
     if not trusted:
         # Untrusted map: keep every known page, scrape only genuinely-new URLs, and
@@ -1232,22 +1659,35 @@ def map_website(
 
 
 @retry(**RETRY_CONFIG)
-def _batch_submit_api_call(urls: list[str], api_key: str) -> dict:
-    """Submit a batch scrape request with automatic retries."""
+def _batch_submit_api_call(
+    urls: list[str],
+    api_key: str,
+    cache_ttl: float = 0,
+    extract_json: bool = True,
+    max_age_ms: int | None = None,
+) -> dict:
+    """Submit a batch scrape request with automatic retries.
+
+    cache_ttl > 0 reuses the job from an identical recent submit (see firecrawl_post);
+    Firecrawl keeps batch results for 24 hours, so the cached job is still pollable.
+    extract_json=False requests markdown only (--no-json): no LLM pass per page.
+    max_age_ms lets Firecrawl serve a page from its own cache if its copy is at
+    most that old (--cache-age-hours); None leaves Firecrawl's default.
+    """
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
     }
+    formats: list = ["markdown"]
+    if extract_json:
+        formats.append({
+            "type": "json",
+            "prompt": JSON_PROMPT,
+            "schema": JSON_SCHEMA,
+        })
     payload = {
         "urls": urls,
-        "formats": [
-            "markdown",
-            {
-                "type": "json",
-                "prompt": JSON_PROMPT,
-                "schema": JSON_SCHEMA,
-            },
-        ],
+        "formats": formats,
         "onlyMainContent": True,
         "excludeTags": [
             "nav",
@@ -1265,13 +1705,10 @@ def _batch_submit_api_call(urls: list[str], api_key: str) -> dict:
         "removeBase64Images": True,
         "blockAds": True,
     }
+    if max_age_ms is not None:
+        payload["maxAge"] = max_age_ms
 
-    resp = requests.post(
-        f"{FIRECRAWL_BASE}/v2/batch/scrape", headers=headers, json=payload,
-        timeout=REQUEST_TIMEOUT,
-    )
-    resp.raise_for_status()
-    data = resp.json()
+    data, _ = firecrawl_post(f"{FIRECRAWL_BASE}/v2/batch/scrape", headers, payload, cache_ttl)
 
     if not data.get("success"):
         raise RuntimeError(
@@ -1282,32 +1719,230 @@ def _batch_submit_api_call(urls: list[str], api_key: str) -> dict:
 
 
 @retry(**RETRY_CONFIG)
-def _batch_poll_api_call(batch_id: str, api_key: str) -> dict:
-    """Poll batch scrape status with automatic retries."""
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-    }
+def _batch_poll_api_call(status_url: str, headers: dict) -> dict:
+    """Poll batch scrape status with automatic retries.
 
-    resp = requests.get(
-        f"{FIRECRAWL_BASE}/v2/batch/scrape/{batch_id}", headers=headers,
-        timeout=REQUEST_TIMEOUT,
-    )
+    The caller builds status_url and headers once per batch, not once per poll.
+    Firecrawl always answers in UTF-8 JSON, so the raw bytes go straight to
+    json.loads — no charset sniffing or intermediate str from resp.json().
+    """
+    resp = SESSION.get(status_url, headers=headers, timeout=REQUEST_TIMEOUT)
     resp.raise_for_status()
-    return resp.json()
+    return json.loads(resp.content)
 
 
 @retry(**RETRY_CONFIG)
-def _batch_next_page_api_call(next_url: str, api_key: str) -> dict:
+def _batch_next_page_api_call(next_url: str, headers: dict) -> dict:
     """Fetch next page of batch results with automatic retries."""
+    resp = SESSION.get(next_url, headers=headers, timeout=REQUEST_TIMEOUT)
+    resp.raise_for_status()
+    return json.loads(resp.content)
+
+
+def _poll_delays(first: float = POLL_INTERVAL_MIN):
+    """Yield sleep times for the batch status loop: exponential backoff with jitter.
+
+    Starts at `first` and grows 1.6x per check up to POLL_INTERVAL_MAX, each delay
+    jittered by +/-20% so parallel batches don't poll in lockstep. Small batches
+    are noticed within ~1s of finishing; long ones aren't hammered.
+    """
+    delay = first
+    while True:
+        yield delay * random.uniform(0.8, 1.2)
+        delay = min(delay * 1.6, POLL_INTERVAL_MAX)
+
+
+def _collect_batch_pages(status_data: dict, headers: dict, label: str) -> list[dict]:
+    """Return a completed batch's pages, following Firecrawl's `next` links.
+
+    Each `next` URL only arrives with the previous page, so one batch's pages are
+    fetched in order; different batches paginate at the same time on their own
+    worker threads, over the shared keep-alive SESSION.
+    """
+    batch_pages = status_data.get("data", [])
+    next_url = status_data.get("next")
+    while next_url:
+        print(f"    {label}: fetching next page of results...")
+        try:
+            next_data = _batch_next_page_api_call(next_url, headers)
+            batch_pages.extend(next_data.get("data", []))
+            next_url = next_data.get("next")
+        except Exception as e:
+            logger.error(f"Pagination failed: {e}")
+            break
+    return batch_pages
+
+
+def _set_batch_state(
+    state: dict,
+    state_lock: threading.Lock,
+    workspace_dir: str,
+    batch_id: str,
+    entry: dict,
+) -> None:
+    """Record one batch's state and persist state.json.
+
+    Batches run on worker threads that share one state dict, so every update +
+    save happens under the lock (save_state's temp-file rename isn't re-entrant).
+    """
+    with state_lock:
+        state["batches"][batch_id] = entry
+        if entry.get("status") == "completed":
+            _BATCH_JSON_CACHE[batch_id] = (
+                entry, _STATE_ENCODER.encode(entry).replace("\n", "\n    ")
+            )
+        save_state(workspace_dir, state)
+
+
+def _scrape_one_batch(
+    batch_num: int,
+    batch_count: int,
+    batch_urls: list[str],
+    batch_id: str,
+    api_key: str,
+    workspace_dir: str,
+    state: dict,
+    state_lock: threading.Lock,
+    cancelled: threading.Event,
+    force_refresh: bool = False,
+    cache_ttl: float = 0,
+    extract_json: bool = True,
+    max_age_ms: int | None = None,
+) -> tuple[list[dict], int]:
+    """Submit (or resume), poll, and collect a single batch.
+
+    Runs on a worker thread. Failures are recorded in state and yield no pages;
+    a rerun resubmits them. Returns (pages, credits_used).
+
+    Once `cancelled` is set (Ctrl-C or another batch raised), nothing new is
+    submitted and polling stops; a submitted batch stays "polling" in state so
+    the next run resumes it instead of paying for it again.
+    """
+    label = f"Batch {batch_num}/{batch_count}"
+    with state_lock:
+        batch_state = dict(state["batches"].get(batch_id, {}))
+
+    print(f"\n  {label} ({len(batch_urls)} URLs)...")
+
+    # --- Check if batch was submitted but not completed (resume) ---
+    firecrawl_batch_id = batch_state.get("firecrawl_batch_id")
+
+    if (
+        not force_refresh
+        and batch_state.get("status") == "polling"
+        and firecrawl_batch_id
+    ):
+        print(f"  {label}: resuming polling for batch {firecrawl_batch_id}")
+    elif cancelled.is_set():
+        return [], 0
+    else:
+        # Submit new batch
+        try:
+            resp_data = _batch_submit_api_call(
+                batch_urls, api_key, 0 if force_refresh else cache_ttl,
+                extract_json, max_age_ms,
+            )
+        except Exception as e:
+            logger.error(f"Batch {batch_num} submit failed after retries: {e}")
+            _set_batch_state(state, state_lock, workspace_dir, batch_id, {
+                "batch_id": batch_id,
+                "urls": batch_urls,
+                "status": "failed",
+                "error": str(e),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            })
+            return [], 0
+
+        firecrawl_batch_id = resp_data["id"]
+        print(f"  {label}: batch ID {firecrawl_batch_id}")
+
+        # Save state as polling (for resume on crash)
+        batch_state = {
+            "batch_id": batch_id,
+            "firecrawl_batch_id": firecrawl_batch_id,
+            "urls": batch_urls,
+            "status": "polling",
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+        _set_batch_state(state, state_lock, workspace_dir, batch_id, batch_state)
+
+    # --- Poll for completion ---
+    max_poll_time = MAX_POLL_TIME * max(1.0, len(batch_urls) / BATCH_SIZE)
+    status_url = f"{FIRECRAWL_BASE}/v2/batch/scrape/{firecrawl_batch_id}"
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
     }
+    start = time.time()
+    status_data: dict = {}
+    delays = _poll_delays()
+    last_completed = 0
+    last_report: tuple = ()
+    last_report_time = 0.0
+
+    while True:
+        if cancelled.wait(next(delays)):
+            return [], 0  # run aborted -- left as "polling" for the next run
+        elapsed = time.time() - start
+        if elapsed > max_poll_time:
+            print(f"  {label}: TIMEOUT after {int(max_poll_time)}s -- skipping batch")
+            _set_batch_state(state, state_lock, workspace_dir, batch_id, {
+                **batch_state, "status": "failed", "error": "poll_timeout",
+            })
+            return [], 0
 
-    resp = requests.get(next_url, headers=headers, timeout=REQUEST_TIMEOUT)
-    resp.raise_for_status()
-    return resp.json()
+        try:
+            status_data = _batch_poll_api_call(status_url, headers)
+        except Exception as e:
+            logger.error(f"Poll failed after retries: {e}")
+            _set_batch_state(state, state_lock, workspace_dir, batch_id, {
+                **batch_state, "status": "failed", "error": str(e),
+            })
+            return [], 0
+
+        status = status_data.get("status", "unknown")
+        completed = status_data.get("completed", 0)
+        total = status_data.get("total", len(batch_urls))
+        # Only report progress -- an unchanged poll stays quiet (batches print
+        # side by side), apart from a heartbeat every POLL_HEARTBEAT seconds.
+        report = (status, completed, total)
+        if report != last_report or elapsed - last_report_time >= POLL_HEARTBEAT:
+            print(f"    {label}: {status} -- {completed}/{total} ({int(elapsed)}s)")
+            last_report, last_report_time = report, elapsed
+
+        # The job is advancing — restart the backoff so we aren't sleeping at the
+        # ceiling when it finishes. Only the last stretch gets 1s checks: a long
+        # batch that advances between most polls would otherwise be polled every
+        # second for its whole run.
+        if isinstance(completed, int) and completed > last_completed:
+            last_completed = completed
+            near_done = isinstance(total, int) and completed >= total * POLL_NEAR_DONE
+            delays = _poll_delays(POLL_INTERVAL_MIN if near_done else POLL_INTERVAL_PROGRESS)
+
+        if status == "completed":
+            break
+        if status == "failed":
+            _set_batch_state(state, state_lock, workspace_dir, batch_id, {
+                **batch_state, "status": "failed", "error": "batch_failed",
+            })
+            return [], 0
+
+    # --- Collect pages (handle pagination via `next`) ---
+    batch_pages = _collect_batch_pages(status_data, headers, label)
+
+    batch_credits = status_data.get("creditsUsed", 0)
+    print(f"  {label}: got {_plural(len(batch_pages), 'page')} ({batch_credits} credits)")
+
+    # Save completed batch to state
+    _set_batch_state(state, state_lock, workspace_dir, batch_id, {
+        "batch_id": batch_id,
+        "firecrawl_batch_id": firecrawl_batch_id,
+        "urls": batch_urls,
+        "status": "completed",
+        "pages": batch_pages,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    })
+    return batch_pages, batch_credits if isinstance(batch_credits, int) else 0
 
 
 def batch_scrape(
@@ -1315,25 +1950,42 @@ def batch_scrape(
     api_key: str,
     workspace_dir: str,
     force_refresh: bool = False,
+    cache_ttl: float = 0,
+    batch_size: int = BATCH_SIZE,
+    extract_json: bool = True,
+    max_age_ms: int | None = None,
+    state: dict | None = None,
 ) -> list[dict]:
     """Scrape URLs in batches with state persistence and resume capability.
 
     Features:
       - Checks state.json for completed batches (skip resubmission)
+      - Runs up to MAX_CONCURRENT_BATCHES batches at once, so wall time tracks
+        the slowest batch rather than the sum of all of them
       - Saves state incrementally after each batch completes
       - Resumes incomplete batches (status=polling) on restart
       - All API calls have automatic retry with exponential backoff
+
+    Pages are returned in batch order regardless of which batch finished first.
+    Batches are keyed by their URL set, so resuming an interrupted run reuses its
+    batches only with the same batch_size.
+
+    `state` is the caller's in-memory state (read from state.json when None); it
+    is updated in place and saved as batches progress.
     """
     print(f"\n{'='*60}")
     print(f"STEP 2: Batch Scrape -- scraping {_plural(len(urls), 'page')}")
     print(f"{'='*60}")
 
-    state = load_state(workspace_dir)
+    if state is None:
+        state = load_state(workspace_dir)
     if "batches" not in state:
         state["batches"] = {}
+    state_lock = threading.Lock()
 
-    all_pages: list[dict] = []
-    batches = [urls[i : i + BATCH_SIZE] for i in range(0, len(urls), BATCH_SIZE)]
+    batches = [urls[i : i + batch_size] for i in range(0, len(urls), batch_size)]
+    pages_by_batch: dict[int, list[dict]] = {}
+    pending: list[tuple[int, list[str], str]] = []
     credits_used = 0
 
     for batch_num, batch_urls in enumerate(batches, 1):
@@ -1347,119 +1999,39 @@ def batch_scrape(
                 f"\n  Batch {batch_num}/{len(batches)}: "
                 f"Using cached result ({len(cached_pages)} pages, 0 credits)"
             )
-            all_pages.extend(cached_pages)
+            pages_by_batch[batch_num] = cached_pages
             continue
+        pending.append((batch_num, batch_urls, batch_id))
 
-        print(f"\n  Batch {batch_num}/{len(batches)} ({len(batch_urls)} URLs)...")
-
-        # --- Check if batch was submitted but not completed (resume) ---
-        firecrawl_batch_id = batch_state.get("firecrawl_batch_id")
-
-        if (
-            not force_refresh
-            and batch_state.get("status") == "polling"
-            and firecrawl_batch_id
-        ):
-            print(f"  Resuming polling for batch {firecrawl_batch_id}")
-        else:
-            # Submit new batch
-            try:
-                resp_data = _batch_submit_api_call(batch_urls, api_key)
-            except Exception as e:
-                logger.error(f"Batch {batch_num} submit failed after retries: {e}")
-                state["batches"][batch_id] = {
-                    "batch_id": batch_id,
-                    "urls": batch_urls,
-                    "status": "failed",
-                    "error": str(e),
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                }
-                save_state(workspace_dir, state)
-                continue
-
-            firecrawl_batch_id = resp_data["id"]
-            print(f"  Batch ID: {firecrawl_batch_id}")
-
-            # Save state as polling (for resume on crash)
-            state["batches"][batch_id] = {
-                "batch_id": batch_id,
-                "firecrawl_batch_id": firecrawl_batch_id,
-                "urls": batch_urls,
-                "status": "polling",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+    if pending:
+        workers = min(MAX_CONCURRENT_BATCHES, len(pending))
+        cancelled = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = {
+                pool.submit(
+                    _scrape_one_batch,
+                    batch_num, len(batches), batch_urls, batch_id, api_key,
+                    workspace_dir, state, state_lock, cancelled, force_refresh,
+                    cache_ttl, extract_json, max_age_ms,
+                ): batch_num
+                for batch_num, batch_urls, batch_id in pending
             }
-            save_state(workspace_dir, state)
-
-        # --- Poll for completion ---
-        start = time.time()
-        status_data: dict = {}
-        poll_succeeded = False
-
-        while True:
-            time.sleep(POLL_INTERVAL)
-            elapsed = time.time() - start
-            if elapsed > MAX_POLL_TIME:
-                print(f"  TIMEOUT after {MAX_POLL_TIME}s -- skipping batch")
-                state["batches"][batch_id]["status"] = "failed"
-                state["batches"][batch_id]["error"] = "poll_timeout"
-                save_state(workspace_dir, state)
-                break
-
-            try:
-                status_data = _batch_poll_api_call(firecrawl_batch_id, api_key)
-            except Exception as e:
-                logger.error(f"Poll failed after retries: {e}")
-                state["batches"][batch_id]["status"] = "failed"
-                state["batches"][batch_id]["error"] = str(e)
-                save_state(workspace_dir, state)
-                break
-
-            status = status_data.get("status", "unknown")
-            completed = status_data.get("completed", 0)
-            total = status_data.get("total", len(batch_urls))
-            print(f"    {status} -- {completed}/{total} ({int(elapsed)}s)")
-
-            if status == "completed":
-                poll_succeeded = True
-                break
-            if status == "failed":
-                state["batches"][batch_id]["status"] = "failed"
-                state["batches"][batch_id]["error"] = "batch_failed"
-                save_state(workspace_dir, state)
-                break
-
-        if not poll_succeeded:
-            continue
-
-        # --- Collect pages (handle pagination via `next`) ---
-        batch_pages = status_data.get("data", [])
-        next_url = status_data.get("next")
-        while next_url:
-            print(f"    Fetching next page of results...")
-            try:
-                next_data = _batch_next_page_api_call(next_url, api_key)
-                batch_pages.extend(next_data.get("data", []))
-                next_url = next_data.get("next")
-            except Exception as e:
-                logger.error(f"Pagination failed: {e}")
-                break
-
-        batch_credits = status_data.get("creditsUsed", 0)
-        credits_used += batch_credits if isinstance(batch_credits, int) else 0
-        print(f"  Got {_plural(len(batch_pages), 'page')} ({batch_credits} credits)")
-
-        # Save completed batch to state
-        state["batches"][batch_id] = {
-            "batch_id": batch_id,
-            "firecrawl_batch_id": firecrawl_batch_id,
-            "urls": batch_urls,
-            "status": "completed",
-            "pages": batch_pages,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-        }
-        save_state(workspace_dir, state)
-
-        all_pages.extend(batch_pages)
+            for future in as_completed(futures):
+                batch_pages, batch_credits = future.result()
+                pages_by_batch[futures[future]] = batch_pages
+                credits_used += batch_credits
+        except BaseException:
+            # Ctrl-C or a worker error: don't let queued batches submit (and bill)
+            # new jobs or poll to completion before the error surfaces.
+            cancelled.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            _BATCH_JSON_CACHE.clear()  # only this run's saves can reuse it
+        pool.shutdown()
+
+    all_pages = [page for num in sorted(pages_by_batch) for page in pages_by_batch[num]]
 
     print(f"\n  Total pages scraped: {len(all_pages)}")
     if credits_used:
@@ -1472,7 +2044,43 @@ def batch_scrape(
 # ---------------------------------------------------------------------------
 
 
-def assemble_pages(pages: list[dict], pages_dir: str) -> dict:
+_PAGE_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_page(filepath: str, content: str, existed: bool) -> str:
+    """Write one page file unless it is already byte-identical.
+
+    Returns "added", "updated", or "unchanged". Runs on assemble_pages' thread
+    pool — each call touches only its own path. `existed` comes from the
+    directory scan assemble_pages does up front, so new files cost no extra stat.
+    """
+    if existed:
+        try:
+            with open(filepath, encoding="utf-8") as f:
+                if f.read() == content:
+                    return "unchanged"  # byte-identical — don't rewrite (no git churn)
+        except OSError:
+            pass  # unreadable — fall through and rewrite it
+
+    # Raw fd write: skips the TextIOWrapper/BufferedWriter stack for a few-KB file,
+    # and O_BINARY keeps Windows from turning "\n" into "\r\n".
+    data = memoryview(content.encode("utf-8"))
+    fd = os.open(filepath, _PAGE_OPEN_FLAGS, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+    return "updated" if existed else "added"
+
+
+# The page fields extract_site_description and generate_site_expansions read;
+# assemble_pages keeps only these per page, not the whole Firecrawl metadata.
+_PAGE_META_KEYS = ("sourceURL", "ogUrl", "title", "description", "ogDescription")
+_PAGE_JSON_KEYS = ("title", "description", "summary")
+
+
+def assemble_pages(pages: Iterable[dict], pages_dir: str, clean: bool = True) -> dict:
     """Write individual page markdown files with YAML frontmatter.
 
     Idempotent: a page whose rendered content is byte-for-byte identical to the file
@@ -1481,71 +2089,119 @@ def assemble_pages(pages: list[dict], pages_dir: str) -> dict:
     report — the content dimension of the sync, since Firecrawl's /map can't tell us
     which existing pages changed.
 
-    Returns {"total", "added", "updated", "unchanged"} where total is the number of
-    page files now present (the skill's page count).
-    """
-    os.makedirs(pages_dir, exist_ok=True)
-    added = updated = unchanged = 0
-
-    for page in pages:
-        metadata = page.get("metadata", {})
-        json_data = page.get("json", {})
-        markdown = page.get("markdown", "")
-
-        if not markdown or not markdown.strip():
-            continue
+    Each page is rendered and handed to a thread pool for writing straight away:
+    the step is dominated by small-file syscalls, which overlap well across threads.
+    At most two writes per worker are in flight, so with a streamed cache only a
+    few page bodies are ever in memory, however large the site.
 
-        source_url = metadata.get("sourceURL") or metadata.get("ogUrl", "")
-        # Prioritize SEO meta tags over LLM extraction (SEO team's work is authoritative)
-        title = metadata.get("title") or json_data.get("title", "Untitled")
-        description = metadata.get("description") or metadata.get("ogDescription") or json_data.get("description", "")
-        summary = json_data.get("summary", "")
-        
-        # Clean HTML tags from LLM-extracted fields (may contain <br> tags from source HTML)
-        if not metadata.get("title"):  # Only clean if from LLM extraction
-            title = strip_html_tags(title)
-        if not metadata.get("description") and not metadata.get("ogDescription"):  # Only clean if from LLM extraction
-            description = strip_html_tags(description)
-        summary = strip_html_tags(summary)  # Summary is always LLM-extracted
-
-        slug = url_to_slug(source_url)
-        filepath = os.path.join(pages_dir, f"{slug}.md")
-
-        # Convert <br> tags to newlines in markdown (Firecrawl may preserve some HTML)
-        markdown = re.sub(r'<br\s*/?>', '\n', markdown, flags=re.IGNORECASE)
-        
-        clean_md = clean_markdown(markdown)
-
-        new_content = (
-            "---\n"
-            f'title: "{yaml_escape(title)}"\n'
-            f'description: "{yaml_escape(description)}"\n'
-            f'url: "{source_url}"\n'
-            "summary: |\n"
-            f"{wrap_summary(summary)}\n"
-            "---\n\n"
-            f"{clean_md}"
-        )
+    `pages` may be any iterable (e.g. a streamed cache) and is consumed once.
+    With clean=False the markdown is written as Firecrawl returned it (only
+    surrounding whitespace is trimmed) — clean_markdown is skipped.
 
-        existed = os.path.exists(filepath)
-        if existed:
-            try:
-                with open(filepath, encoding="utf-8") as f:
-                    if f.read() == new_content:
-                        unchanged += 1
-                        continue  # byte-identical — don't rewrite (no git churn)
-            except OSError:
-                pass  # unreadable — fall through and rewrite it
+    Returns {"total", "added", "updated", "unchanged", "page_meta"} where total is
+    the number of page files now present (the skill's page count) and page_meta
+    keeps each page's title/description/summary fields without the markdown
+    body — all that the SKILL.md description and expansion steps need.
+    """
+    os.makedirs(pages_dir, exist_ok=True)
+    # One directory scan instead of an exists() stat per page.
+    with os.scandir(pages_dir) as it:
+        on_disk = {entry.path for entry in it}
+
+    page_meta: list[dict] = []
+    # slug -> source URL. Last page wins when two URLs share a slug: its write
+    # simply replaces the earlier file, so no page body is held back for it.
+    sources: dict[str, str] = {}
+    collisions: list[tuple[str, str]] = []  # (dropped URL, kept URL)
+    outcomes: dict[str, str] = {}  # slug -> "added" / "updated" / "unchanged"
+    in_flight: deque[tuple[str, Future]] = deque()
+
+    def settle(limit: int) -> None:
+        """Wait for the oldest writes until at most `limit` are in flight."""
+        while len(in_flight) > limit:
+            slug, future = in_flight.popleft()
+            outcome = future.result()
+            # A slug written twice counts as changed if either write changed it.
+            if outcomes.get(slug, "unchanged") == "unchanged":
+                outcomes[slug] = outcome
+
+    prefix = os.path.join(pages_dir, "")  # joined once; each page appends "{slug}.md"
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for page in pages:
+            metadata = page.get("metadata", {})
+            json_data = page.get("json") or {}
+            markdown = page.get("markdown", "")
+            page_meta.append({
+                "metadata": {k: metadata[k] for k in _PAGE_META_KEYS if k in metadata},
+                "json": {k: json_data[k] for k in _PAGE_JSON_KEYS if k in json_data},
+            })
+
+            if not markdown or not markdown.strip():
+                continue
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(new_content)
-        if existed:
-            updated += 1
-        else:
-            added += 1
+            source_url = metadata.get("sourceURL") or metadata.get("ogUrl", "")
+            slug = url_to_slug(source_url)
+            if slug in sources:
+                if sources[slug] != source_url:
+                    collisions.append((sources[slug], source_url))
+                settle(0)  # never write one file from two threads at once
+            sources[slug] = source_url
+
+            # Prioritize SEO meta tags over LLM extraction (SEO team's work is authoritative)
+            title = metadata.get("title") or json_data.get("title", "Untitled")
+            description = metadata.get("description") or metadata.get("ogDescription") or json_data.get("description", "")
+            summary = json_data.get("summary", "")
+            
+            # Clean HTML tags from LLM-extracted fields (may contain <br> tags from source HTML)
+            if not metadata.get("title"):  # Only clean if from LLM extraction
+                title = strip_html_tags(title)
+            if not metadata.get("description") and not metadata.get("ogDescription"):  # Only clean if from LLM extraction
+                description = strip_html_tags(description)
+            summary = strip_html_tags(summary)  # Summary is always LLM-extracted
+
+            filepath = f"{prefix}{slug}.md"
+
+            # Convert <br> tags to newlines in markdown (Firecrawl may preserve some HTML)
+            if "<" in markdown:
+                markdown = _BR_TAG_RE.sub('\n', markdown)
+            
+            clean_md = clean_markdown(markdown) if clean else markdown.strip()
+
+            new_content = (
+                "---\n"
+                f"title: {yaml_quote(title)}\n"
+                f"description: {yaml_quote(description)}\n"
+                f'url: "{source_url}"\n'
+                "summary: |\n"
+                f"{wrap_summary(summary)}\n"
+                "---\n\n"
+                f"{clean_md}"
+            )
 
-    total = added + updated + unchanged
-    return {"total": total, "added": added, "updated": updated, "unchanged": unchanged}
+            settle(2 * workers - 1)
+            in_flight.append(
+                (slug, pool.submit(_write_page, filepath, new_content, filepath in on_disk))
+            )
+        settle(0)
+
+    if collisions:
+        # Renaming colliding files would churn existing slugs, so report instead.
+        print(f"  {_plural(len(collisions), 'page')} shared a file with a later URL -- kept the later one:")
+        for dropped, kept in collisions[:5]:
+            print(f"    {dropped} -> {kept}")
+        if len(collisions) > 5:
+            print(f"    ... and {len(collisions) - 5} more")
+
+    added = sum(1 for outcome in outcomes.values() if outcome == "added")
+    updated = sum(1 for outcome in outcomes.values() if outcome == "updated")
+    return {
+        "total": len(outcomes),
+        "added": added,
+        "updated": updated,
+        "unchanged": len(outcomes) - added - updated,
+        "page_meta": page_meta,
+    }
 
 
 def extract_site_description(
@@ -1596,7 +2252,7 @@ def extract_site_description(
             break
     
     if homepage:
-        json_data = homepage.get("json", {})
+        json_data = homepage.get("json") or {}
         metadata = homepage.get("metadata", {})
         
         # Priority: json.description > condensed json.summary > metadata.description > ogDescription
@@ -1679,7 +2335,7 @@ def extract_site_description(
     # Tier 3: Infer from page titles
     titles = []
     for page in pages[:20]:  # First 20 pages
-        json_data = page.get("json", {})
+        json_data = page.get("json") or {}
         metadata = page.get("metadata", {})
         title = json_data.get("title") or metadata.get("title", "")
         if title:
@@ -1721,7 +2377,7 @@ def generate_site_expansions(pages: list[dict]) -> str:
     corpus_parts = []
     for page in pages:
         metadata = page.get("metadata", {})
-        json_data = page.get("json", {})
+        json_data = page.get("json") or {}
         title = metadata.get("title") or json_data.get("title") or ""
         summary = json_data.get("summary") or ""
         corpus_parts.append(f"{title} {summary}".lower())
@@ -1801,6 +2457,11 @@ def generate_site_expansions(pages: list[dict]) -> str:
     return header + "\n".join(matched_lines)
 
 
+# The five {variables} skill-md.template may use. Any other brace text (shell
+# snippets, JSON examples) is copied through as-is.
+_TEMPLATE_VAR_RE = re.compile(r"\{(domain|skill_name|site_description|page_count|site_expansions)\}")
+
+
 def generate_skill_md(
     output_dir: str,
     domain: str,
@@ -1819,6 +2480,9 @@ def generate_skill_md(
       {site_description}   -- one-line description of the website
       {page_count}         -- total number of pages in the skill folder
       {site_expansions}    -- site-specific query expansion hints (may be empty)
+    They are filled in one regex pass rather than str.format, so literal braces
+    in the template need no {{ }} escaping and a value that itself contains
+    "{domain}" is never substituted again.
     See plan.md D6 for rationale.
     """
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -1827,13 +2491,14 @@ def generate_skill_md(
     with open(template_path, encoding="utf-8") as f:
         template = f.read()
 
-    skill_md = template.format(
-        domain=domain,
-        skill_name=skill_name,
-        site_description=site_description,
-        page_count=page_count,
-        site_expansions=site_expansions,
-    )
+    values = {
+        "domain": domain,
+        "skill_name": skill_name,
+        "site_description": site_description,
+        "page_count": str(page_count),
+        "site_expansions": site_expansions,
+    }
+    skill_md = _TEMPLATE_VAR_RE.sub(lambda m: values[m.group(1)], template)
 
     skill_path = os.path.join(output_dir, "SKILL.md")
     with open(skill_path, "w", encoding="utf-8") as f:
@@ -1845,11 +2510,17 @@ def generate_skill_md(
 # ---------------------------------------------------------------------------
 
 
+def credits_per_page(no_json: bool = False) -> int:
+    """Estimated Firecrawl credits to scrape one page (markdown, plus JSON unless no_json)."""
+    return SCRAPE_CREDITS_PER_PAGE + (0 if no_json else JSON_CREDITS_PER_PAGE)
+
+
 def prompt_cost_approval(
     urls_to_scrape: list[str],
     output_dir: str,
     auto_approve: bool,
     max_pages: int | None = None,
+    no_json: bool = False,
 ) -> bool:
     """Show estimated Firecrawl credit cost and ask user to approve.
 
@@ -1859,10 +2530,11 @@ def prompt_cost_approval(
 
     Cost model:
       - Map:   1 credit (already spent by this point)
-      - Scrape: ~5 credits per page
+      - Scrape: ~5 credits per page (~1 with --no-json)
     """
+    per_page = credits_per_page(no_json)
     scrape_count = len(urls_to_scrape)
-    scrape_cost = scrape_count * 5
+    scrape_cost = scrape_count * per_page
     total_cost = 1 + scrape_cost
 
     # Detect new vs update by checking for existing SKILL.md
@@ -1879,7 +2551,7 @@ def prompt_cost_approval(
         print(f"  Max pages limit:  {max_pages}")
     print(f"")
     print(f"  Credits already used:  1  (map)")
-    print(f"  Credits remaining:     ~{scrape_cost}  ({_plural(scrape_count, 'page')} x 5 credits)")
+    print(f"  Credits remaining:     ~{scrape_cost}  ({_plural(scrape_count, 'page')} x {per_page} credits)")
     print(f"  Total estimated cost:  ~{total_cost} credits")
     print(f"{'='*60}")
 
@@ -2119,14 +2791,26 @@ def _generate_repo_scaffolding(
     elif new_page_count == 0 and not config.force_refresh:
         credits_used = 1
     else:
-        credits_used = 1 + new_page_count * 5
+        credits_used = 1 + new_page_count * credits_per_page(config.no_json)
 
-    # .gitignore: write only if doesn't exist
+    # .gitignore: create if missing, and make sure every local-only cache name is
+    # listed — repos created before the cache was gzipped only ignore the .json name.
     gitignore_path = os.path.join(work_dir, ".gitignore")
+    ignored = [f"dev/_workspace/{name}" for name in (LEGACY_PAGE_CACHE_FILE, PAGE_CACHE_FILE)]
     if not os.path.exists(gitignore_path):
         with open(gitignore_path, "w", encoding="utf-8") as f:
-            f.write("dev/_workspace/batch-response.json\n")
+            f.write("".join(f"{line}\n" for line in ignored))
         print(f"  Created .gitignore")
+    else:
+        with open(gitignore_path, encoding="utf-8") as f:
+            existing = f.read()
+        missing = [line for line in ignored if line not in existing.splitlines()]
+        if missing:
+            with open(gitignore_path, "a", encoding="utf-8") as f:
+                if existing and not existing.endswith("\n"):
+                    f.write("\n")
+                f.write("".join(f"{line}\n" for line in missing))
+            print(f"  Updated .gitignore")
 
     # dev/notes.md: append if exists, create if doesn't
     os.makedirs(os.path.join(work_dir, "dev"), exist_ok=True)
@@ -2361,7 +3045,7 @@ def _run_pipeline(
             if fname.endswith(".md"):
                 os.remove(os.path.join(pages_dir, fname))
                 removed += 1
-        for cache_file in ("state.json", "batch-response.json", "map-urls.txt", "map-request.json"):
+        for cache_file in WORKSPACE_CACHE_FILES:
             fp = os.path.join(workspace_dir, cache_file)
             if os.path.exists(fp):
                 os.remove(fp)
@@ -2384,32 +3068,27 @@ def _run_pipeline(
             print(f"  {owner}/{repo_name} does not exist yet. Run without --skip-scrape first.")
             sys.exit(1)
 
-        # Try state.json first (more granular), fall back to batch-response.json
+        # Try state.json first (more granular), fall back to the batch-response cache
         state = load_state(workspace_dir)
 
         if state.get("batches"):
             print(f"\nLoading cached data from state.json")
-            pages: list[dict] = []
-            for batch_state in state["batches"].values():
-                if batch_state.get("status") == "completed":
-                    pages.extend(batch_state.get("pages", []))
-            print(f"  Loaded {len(pages)} pages from state cache")
+            completed = [
+                b.get("pages", [])
+                for b in state["batches"].values()
+                if b.get("status") == "completed"
+            ]
+            pages: Iterable[dict] = itertools.chain.from_iterable(completed)
+            print(f"  Loaded {sum(map(len, completed))} pages from state cache")
         else:
-            # Backward compatibility: load from batch-response.json
-            cache_path = os.path.join(workspace_dir, "batch-response.json")
-            if not os.path.exists(cache_path):
+            # Backward compatibility: stream from the batch-response cache
+            cache_path = page_cache_path(workspace_dir)
+            if not cache_path:
                 print(f"\nERROR: No committed cache in {owner}/{repo_name} (dev/_workspace/).")
                 print("Run without --skip-scrape first.")
                 sys.exit(1)
-            print(f"\nSkipping map+scrape, loading cached data from {cache_path}")
-            with open(cache_path, encoding="utf-8") as f:
-                scrape_data = json.load(f)
-            pages = (
-                scrape_data
-                if isinstance(scrape_data, list)
-                else scrape_data.get("data", [])
-            )
-            print(f"  Loaded {len(pages)} pages from batch-response.json")
+            print(f"\nSkipping map+scrape, streaming cached data from {cache_path}")
+            pages = iter_page_cache(cache_path)
 
         new_page_count = 0  # Nothing scraped in idempotent mode
 
@@ -2427,11 +3106,13 @@ def _run_pipeline(
             skip_scrape=False,
             force_refresh=config.force_refresh,
             allow_mass_deletion=config.allow_mass_deletion,
+            cache_ttl=config.api_cache_hours * 3600,
         )
 
         total_urls_mapped = len(map_result["urls"])
 
         # Record the fresh map snapshot (persisted only on a real run, below).
+        # This one in-memory state also feeds the cache lookups and Step 2.
         state = load_state(workspace_dir)
         state["map"] = {
             "urls": map_result["urls"],
@@ -2493,13 +3174,13 @@ def _run_pipeline(
             # — this is what made a "~6 credit" dry-run become a ~386 credit run.
             backfill = 0
             if not config.force_refresh and map_result["unchanged_urls"]:
-                existing = load_existing_pages(map_result["unchanged_urls"], workspace_dir)
+                existing = load_existing_pages(map_result["unchanged_urls"], workspace_dir, state)
                 backfill = len(unscraped_unchanged_urls(map_result["unchanged_urls"], existing))
 
             pages_to_scrape = total_urls if config.force_refresh else new_urls + backfill
             capped = bool(config.max_pages and pages_to_scrape > config.max_pages)
             scrape_count = config.max_pages if capped else pages_to_scrape
-            scrape_cost = scrape_count * 5
+            scrape_cost = scrape_count * credits_per_page(config.no_json)
 
             print(f"\n{'='*60}")
             print(f"DRY RUN — summary (no scraping performed)")
@@ -2535,7 +3216,7 @@ def _run_pipeline(
             # Incremental: only scrape new URLs, load existing from cache
             urls_to_scrape = map_result["new_urls"]
             existing_pages = load_existing_pages(
-                map_result["unchanged_urls"], workspace_dir
+                map_result["unchanged_urls"], workspace_dir, state
             )
             print(
                 f"\n  Incremental: scraping {_plural(len(urls_to_scrape), 'new URL')} "
@@ -2545,7 +3226,7 @@ def _run_pipeline(
             # No new URLs -- load everything from cache
             urls_to_scrape = []
             existing_pages = load_existing_pages(
-                map_result["unchanged_urls"], workspace_dir
+                map_result["unchanged_urls"], workspace_dir, state
             )
             print(
                 f"\n  No new URLs -- reusing {len(existing_pages)} cached pages"
@@ -2590,6 +3271,7 @@ def _run_pipeline(
                 skill_output,
                 auto_approve=config.yes,
                 max_pages=config.max_pages,
+                no_json=config.no_json,
             )
             if not approved:
                 print_cancelled_message(config.domain)
@@ -2602,6 +3284,14 @@ def _run_pipeline(
                 api_key,
                 workspace_dir,
                 force_refresh=config.force_refresh,
+                cache_ttl=config.api_cache_hours * 3600,
+                batch_size=config.batch_size,
+                extract_json=not config.no_json,
+                max_age_ms=(
+                    None if config.cache_age_hours is None
+                    else int(config.cache_age_hours * 3_600_000)
+                ),
+                state=state,
             )
         else:
             new_pages = []
@@ -2610,11 +3300,16 @@ def _run_pipeline(
         pages = existing_pages + new_pages
         new_page_count = len(new_pages)
 
-        # Save consolidated batch-response.json (backward compatibility)
-        cache_path = os.path.join(workspace_dir, "batch-response.json")
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump(pages, f, indent=2, ensure_ascii=False)
-        print(f"  Cached scrape data to {cache_path}")
+        # Save consolidated batch-response cache (backward compatibility). Every
+        # page is already in state.json or in this cache, so with nothing newly
+        # scraped an existing cache is kept rather than re-serialized -- unless it
+        # is damaged, in which case rewriting it is the repair.
+        cache_path = page_cache_path(workspace_dir)
+        if new_pages or not cache_path or not page_cache_intact(cache_path):
+            cache_path = save_page_cache(workspace_dir, pages)
+            print(f"  Cached scrape data to {cache_path}")
+        else:
+            print(f"  No new pages -- kept {cache_path}")
 
     # -------------------------------------------------------------------
     # Step 3: Assemble
@@ -2623,7 +3318,7 @@ def _run_pipeline(
     print(f"STEP 3: Assemble -- building skill folder")
     print(f"{'='*60}")
 
-    assembly = assemble_pages(pages, pages_dir)
+    assembly = assemble_pages(pages, pages_dir, clean=not config.no_clean)
     page_count = assembly["total"]
     print(f"  {_plural(page_count, 'page file')} in {pages_dir}/ "
           f"({assembly['added']} added, {assembly['updated']} updated, "
@@ -2642,13 +3337,13 @@ def _run_pipeline(
 
     # Extract site description with auto-extraction fallback
     site_description = extract_site_description(
-        pages,
+        assembly["page_meta"],
         config.domain,
         config.description if config.description else None,
     )
     print(f"  Site description: {site_description}")
 
-    site_expansions = generate_site_expansions(pages)
+    site_expansions = generate_site_expansions(assembly["page_meta"])
     if site_expansions:
         print(f"  Generated site-specific query expansions")
 
@@ -2697,8 +3392,8 @@ def _run_pipeline(
         credits_str = "~1 (map only, no new pages)"
     else:
         credits_str = (
-            f"~{1 + new_page_count * 5} "
-            f"(1 map + {_plural(new_page_count, 'page')} x 5 scrape)"
+            f"~{1 + new_page_count * credits_per_page(config.no_json)} "
+            f"(1 map + {_plural(new_page_count, 'page')} x {credits_per_page(config.no_json)} scrape)"
         )
 
     # Summary — clear, copy-paste orchestration for install + share + update.